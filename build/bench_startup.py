@@ -0,0 +1,246 @@
+"""
+Бенчмарк: „време до интерактивен начален екран“ + отваряне на уроците.
+
+Всяко повторение е отделен процес (за да се мери и импортът на gui.py):
+  • фазите на стартиране от StartupProfiler (import, window, decode ..., home_layout, first_idle)
+  • home_ready_ms – от началото на импорта до първия обработен idle
+  • за всеки урок: build_ms (build_lesson_screen + показване), а през
+    open_lesson: cold_open_ms (frame-ът не е изграден), prebuilt_open_ms
+    (изграден предварително при idle) и reopen_ms (вече показван);
+    quiz_toggle_ms (Урок → Въпроси → Урок)
+
+Отварянията мерят само показването на урока: предварителното изграждане на
+следващите уроци, което open_lesson нарежда за idle, се отменя преди засичането.
+
+Резултатът (медиани по повторенията) се записва като JSON. С --baseline
+сравнява със стар резултат и връща код 1 при регресия над --threshold.
+
+Нужен е дисплей: ако няма DISPLAY, се пуска Xvfb (ако е инсталиран).
+
+    python bench_startup.py --repeat 5 --out bench_results.json
+    python bench_startup.py --baseline bench_results.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).parent
+
+
+# ---------- ЕДНО ИЗМЕРВАНЕ (в дъщерния процес) ----------
+def _settle(window):
+    """Обработва всички чакащи събития/idle задачи (= екранът е нарисуван)."""
+    window.update_idletasks()
+    window.update()
+
+
+def _ms_since(t0):
+    return (time.perf_counter() - t0) * 1000
+
+
+def _timed_open(gui, n):
+    """Време за open_lesson(n) до нарисуван екран, без prebuild на следващите."""
+    t0 = time.perf_counter()
+    gui.open_lesson(n)
+    gui.lesson_frames.cancel()  # иначе _settle би изградил и урок n+1
+    _settle(gui.window)
+    return _ms_since(t0)
+
+
+def run_child():
+    os.environ.setdefault("QA_APP_PROFILE", os.devnull)
+    sys.path.insert(0, str(HERE))
+    import gui  # изгражда началния екран, без mainloop
+
+    window = gui.window
+    _settle(window)  # тук се изпълняват PROFILE.finish (first_idle) и prebuild на урок 1
+    # До маркера first_idle, без предварителното изграждане след него
+    home_ready_ms = next(p["start_ms"] for p in gui.PROFILE.as_dict()["phases"]
+                         if p["name"] == "first_idle")
+
+    lessons = {}
+    for n in sorted(gui.lessons_data):
+        title, content, headings, quiz = gui.lessons_data[n][:4]
+        images = gui.lessons_data[n][4]
+
+        # 1) Чисто изграждане на екрана (без кеша на frame-овете)
+        t0 = time.perf_counter()
+        fr = gui.build_lesson_screen(window, title, content, headings, quiz,
+                                     go_back_cb=lambda: None,
+                                     image_files=images)
+        fr.pack(fill="both", expand=True)
+        _settle(window)
+        build_ms = _ms_since(t0)
+        fr.destroy()
+
+        # 2) Отваряне през навигацията на приложението: студено (без готов
+        #    frame), след предварително изграждане при idle и повторно
+        gui.lesson_frames.cancel()
+        gui.lesson_frames.discard(n)
+        cold_open_ms = _timed_open(gui, n)
+
+        gui.hide_all_lessons()
+        gui.lesson_frames.discard(n)
+        gui.lesson_frames.prebuild([n])
+        _settle(window)  # тук (извън засичането) се изгражда урок n
+        prebuilt_open_ms = _timed_open(gui, n)
+
+        gui.hide_all_lessons()
+        _settle(window)
+        reopen_ms = _timed_open(gui, n)
+
+        # 3) Превключване Урок → Въпроси → Урок
+        fr = gui.lesson_frames.get(n)
+        t0 = time.perf_counter()
+        fr.show_quiz()
+        _settle(window)
+        fr.show_lesson()
+        _settle(window)
+        quiz_toggle_ms = _ms_since(t0)
+
+        gui.hide_all_lessons()
+        _settle(window)
+        lessons[str(n)] = {
+            "build_ms": build_ms,
+            "cold_open_ms": cold_open_ms,
+            "prebuilt_open_ms": prebuilt_open_ms,
+            "reopen_ms": reopen_ms,
+            "quiz_toggle_ms": quiz_toggle_ms,
+        }
+
+    result = {
+        "home_ready_ms": home_ready_ms,
+        "frames": {k: gui.lesson_frames.stats()[k]
+                   for k in ("hits", "misses", "prebuilt_hits")},
+        "phases": {p["name"]: p["ms"]
+                   for p in gui.PROFILE.as_dict()["phases"]},
+        "lessons": lessons,
+    }
+    window.destroy()
+    gui.image_cache.shutdown()
+    print()  # JSON-ът е на последния ред (над него може да има предупреждения)
+    print(json.dumps(result))
+
+
+# ---------- ОРКЕСТРАЦИЯ ----------
+def _ensure_display():
+    """Връща Popen на пуснат Xvfb (или None, ако вече има дисплей)."""
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    if not shutil.which("Xvfb"):
+        sys.exit("Няма DISPLAY и Xvfb не е инсталиран.")
+    display = ":99"
+    proc = subprocess.Popen(["Xvfb", display, "-screen", "0", "1440x1024x24"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return proc
+
+
+def _median(runs, path):
+    """Медиана по повторенията за вложения ключ `path` (tuple)."""
+    values = []
+    for r in runs:
+        for key in path:
+            r = r.get(key) if isinstance(r, dict) else None
+        if r is not None:
+            values.append(r)
+    return round(statistics.median(values), 3) if values else None
+
+
+def aggregate(runs):
+    first = runs[0]
+    return {
+        "home_ready_ms": _median(runs, ("home_ready_ms",)),
+        "phases": {name: _median(runs, ("phases", name))
+                   for name in first["phases"]},
+        "lessons": {n: {k: _median(runs, ("lessons", n, k)) for k in metrics}
+                    for n, metrics in first["lessons"].items()},
+    }
+
+
+def flatten(result, prefix=""):
+    """{'lessons': {'1': {'build_ms': 3}}} → {'lessons.1.build_ms': 3}"""
+    flat = {}
+    for k, v in result.items():
+        if isinstance(v, dict):
+            flat.update(flatten(v, f"{prefix}{k}."))
+        elif isinstance(v, (int, float)):
+            flat[f"{prefix}{k}"] = v
+    return flat
+
+
+def compare(current, baseline, threshold):
+    """Връща списък с метрики, които са по-бавни от baseline с > threshold."""
+    cur, base = flatten(current["results"]), flatten(baseline["results"])
+    regressions = []
+    for key, old in base.items():
+        new = cur.get(key)
+        if new is None or old <= 1.0:  # под 1 ms шумът доминира
+            continue
+        if new > old * (1 + threshold):
+            regressions.append(f"{key}: {old:.1f} → {new:.1f} ms")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--out", default="bench_results.json")
+    ap.add_argument("--baseline")
+    ap.add_argument("--threshold", type=float, default=0.2)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    xvfb = _ensure_display()
+    try:
+        runs = []
+        for _ in range(args.repeat):
+            out = subprocess.run([sys.executable, __file__, "--child"],
+                                 check=True, capture_output=True, text=True)
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    sys.path.insert(0, str(HERE))
+    from content_pack import ContentPack
+    pack = ContentPack(HERE / "lessons.qapack")
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "lessons": len(pack),
+            "pack_bytes": (HERE / "lessons.qapack").stat().st_size,
+        },
+        "results": aggregate(runs),
+    }
+    pack.close()
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+    print(f"home_ready_ms={report['results']['home_ready_ms']} → {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print("РЕГРЕСИЯ", line)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Пакет със съдържание на уроците (lessons.qapack).
+
+Формат (всички числа са big-endian):
+    MAGIC (4 байта) | VERSION (u16) | дължина на индекса (u32) | индекс (JSON, utf-8) | тела
+
+Индексът съдържа за всеки урок: id, заглавие, отместване и дължина на тялото
+(спрямо началото на телата) и списък с асети. Всяко тяло е отделен JSON с
+текста, секциите и въпросите на урока (с тема/секция за всеки въпрос) и
+готов индекс {секция: [въпроси]} за `QuestionPool`.
+
+При стартиране се чете само индексът; телата се четат през mmap, когато урокът
+се отвори. `compile_pack` проверява данните и пише пакета предварително:
+
+    python content_pack.py            # проверка + компилиране от lessons_src.py
+    python content_pack.py --check    # само проверка
+"""
+import importlib.util
+import json
+import mmap
+import os
+import struct
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+
+from question_pool import tag_quiz
+
+MAGIC = b"QAPK"
+VERSION = 2
+_HEADER = struct.Struct(">4sHI")
+
+
+class PackError(ValueError):
+    """Невалидно съдържание или повреден пакет."""
+
+
+# ---------- ПРОВЕРКА ----------
+def validate_lesson(n, entry, assets_dir=None):
+    """Връща списък с проблеми в урок n (празен списък = всичко е наред)."""
+    errors = []
+    if len(entry) < 4:
+        return [f"Урок {n}: очакват се (title, content, headings, quiz[, images])"]
+    title, content, headings, quiz = entry[:4]
+    images = entry[4] if len(entry) > 4 else []
+
+    if not title.strip():
+        errors.append(f"Урок {n}: липсва заглавие")
+
+    lines = [ln.strip() for ln in content.splitlines() if ln.strip()]
+    for line, count in Counter(lines).items():
+        if count > 1:
+            errors.append(f"Урок {n}: повторен ред ({count}x): {line!r}")
+    present = set(lines)
+    for h in sorted(headings):
+        if h not in present:
+            errors.append(f"Урок {n}: секцията {h!r} я няма в текста")
+
+    for i, q in enumerate(quiz, 1):
+        if len(q) < 3:
+            errors.append(f"Урок {n}, въпрос {i}: очаква се (въпрос, опции, верен индекс)")
+            continue
+        text, opts, correct = q[:3]
+        if not text.strip():
+            errors.append(f"Урок {n}, въпрос {i}: празен текст")
+        if len(opts) < 2:
+            errors.append(f"Урок {n}, въпрос {i}: нужни са поне 2 опции")
+        if len(set(opts)) != len(opts):
+            errors.append(f"Урок {n}, въпрос {i}: повторени опции")
+        if not (isinstance(correct, int) and 0 <= correct < len(opts)):
+            errors.append(f"Урок {n}, въпрос {i}: верният индекс {correct!r} е извън опциите")
+        if len(q) > 3 and q[3] and q[3] not in headings:
+            errors.append(f"Урок {n}, въпрос {i}: темата {q[3]!r} не е секция от урока")
+
+    return errors + missing_assets(n, images, assets_dir)
+
+
+def missing_assets(n, images, assets_dir=None):
+    """Съобщения за липсващите картинки на урок n (без `assets_dir` – няма проверка)."""
+    if assets_dir is None:
+        return []
+    return [f"Урок {n}: липсва асет {fname}" for fname in images
+            if not (Path(assets_dir) / fname).exists()]
+
+
+# ---------- КОМПИЛИРАНЕ ----------
+def compile_pack(lessons, path, assets_dir=None, strict_assets=True):
+    """
+    Проверява `lessons` (lesson_no -> entry) и записва пакета в `path`.
+    С `strict_assets=False` липсващите картинки са само предупреждения
+    (екранът на урока ги пропуска), а не грешка.
+    """
+    errors, warnings = [], []
+    for n in sorted(lessons):
+        entry = lessons[n]
+        errors.extend(validate_lesson(n, entry))
+        images = entry[4] if len(entry) > 4 else []
+        (errors if strict_assets else warnings).extend(
+            missing_assets(n, images, assets_dir))
+    if errors:
+        raise PackError("\n".join(errors))
+    for w in warnings:
+        print(f"Предупреждение: {w}")
+
+    index, bodies, offset = [], [], 0
+    for n in sorted(lessons):
+        entry = lessons[n]
+        title, content, headings, quiz = entry[:4]
+        images = list(entry[4]) if len(entry) > 4 else []
+        tagged, strata = tag_quiz(content, headings, quiz)
+        body = json.dumps({
+            "content": content,
+            "headings": sorted(headings),
+            "quiz": [list(q) for q in tagged],
+            "strata": strata,
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index.append({"id": n, "title": title, "offset": offset,
+                      "length": len(body), "assets": images})
+        bodies.append(body)
+        offset += len(body)
+
+    idx = json.dumps(index, ensure_ascii=False,
+                     separators=(",", ":")).encode("utf-8")
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, VERSION, len(idx)))
+        fh.write(idx)
+        for body in bodies:
+            fh.write(body)
+    os.replace(tmp, path)  # атомарно: gui.py никога не вижда наполовина записан пакет
+    return path
+
+
+def load_source(source_path):
+    """Импортира lessons_src.py по път и връща неговия `lessons_data`."""
+    spec = importlib.util.spec_from_file_location("lessons_src", source_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.lessons_data
+
+
+# ---------- ЧЕТЕНЕ ----------
+class ContentPack(Mapping):
+    """
+    Речник lesson_no -> (title, content, headings, quiz, images) върху пакета.
+
+    При отваряне се чете само индексът; телата се декодират при първия
+    достъп до урока и се пазят, докато пакетът е отворен.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            raise PackError(f"{self.path}: файлът е твърде кратък")
+        magic, version, idx_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise PackError(f"{self.path}: непознат формат ({magic!r} v{version})")
+        start = _HEADER.size
+        self._body_start = start + idx_len
+        self.index = {e["id"]: e for e in json.loads(
+            self._mm[start:self._body_start].decode("utf-8"))}
+        self._loaded = {}
+        self._strata = {}
+
+    def title(self, n):
+        return self.index[n]["title"]
+
+    def assets(self, n):
+        return self.index[n]["assets"]
+
+    def _decode(self, n):
+        meta = self.index[n]
+        a = self._body_start + meta["offset"]
+        body = json.loads(self._mm[a:a + meta["length"]].decode("utf-8"))
+        entry = (
+            meta["title"],
+            body["content"],
+            set(body["headings"]),
+            [tuple(q) for q in body["quiz"]],
+            list(meta["assets"]),
+        )
+        return entry, body["strata"]
+
+    def __getitem__(self, n):
+        if n in self._loaded:
+            return self._loaded[n]
+        entry, self._strata[n] = self._decode(n)
+        self._loaded[n] = entry
+        return entry
+
+    def read(self, n):
+        """Като pack[n], но без да задържа урока в паметта (за еднократно обхождане)."""
+        if n in self._loaded:
+            return self._loaded[n]
+        return self._decode(n)[0]
+
+    def strata(self, n):
+        """{секция: [индекси на въпроси]} за урок n (изчислено при компилиране)."""
+        if n not in self._strata:
+            self[n]
+        return self._strata[n]
+
+    def __contains__(self, n):
+        return n in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def close(self):
+        self._mm.close()
+
+
+def _pack_version(path):
+    with open(path, "rb") as fh:
+        head = fh.read(_HEADER.size)
+    if len(head) < _HEADER.size:
+        return None
+    magic, version, _idx_len = _HEADER.unpack(head)
+    return version if magic == MAGIC else None
+
+
+def _is_fresh(pack_path, source_path):
+    return (pack_path.exists()
+            and pack_path.stat().st_mtime >= source_path.stat().st_mtime
+            and _pack_version(pack_path) == VERSION)
+
+
+def load_pack(pack_path, source_path=None, assets_dir=None, cache_dir=None):
+    """
+    Отваря пакета. Ако липсва, е от стара версия на формата или е по-стар от
+    изходника `source_path`, първо го прекомпилира (с проверка; липсващите
+    картинки са само предупреждения). Без изходник (разпространява се само
+    пакетът) се ползва пакетът както е.
+
+    Ако папката на пакета не може да се пише (напр. инсталация само за четене),
+    пакетът се компилира в `cache_dir` (папка на потребителя).
+    """
+    pack_path = Path(pack_path)
+    if source_path is None or not Path(source_path).exists():
+        return ContentPack(pack_path)
+    source_path = Path(source_path)
+    candidates = [pack_path]
+    if cache_dir is not None:
+        candidates.append(Path(cache_dir) / pack_path.name)
+
+    for path in candidates:
+        if _is_fresh(path, source_path):
+            return ContentPack(path)
+    lessons = load_source(source_path)
+    for path in candidates:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return ContentPack(compile_pack(lessons, path, assets_dir,
+                                            strict_assets=False))
+        except OSError as e:
+            if path == candidates[-1]:
+                raise
+            print(f"Неуспешен запис на пакета {path}: {e}")
+
+
+if __name__ == "__main__":
+    here = Path(__file__).parent
+    lessons = load_source(here / "lessons_src.py")
+    assets = here / "assets" / "frame0"
+    if "--check" in sys.argv:
+        problems = [e for n in sorted(lessons)
+                    for e in validate_lesson(n, lessons[n], assets)]
+        print("\n".join(problems) or f"OK: {len(lessons)} урока")
+        sys.exit(1 if problems else 0)
+    try:
+        out = compile_pack(lessons, here / "lessons.qapack", assets)
+    except PackError as e:
+        print(e)
+        sys.exit(1)
+    print(f"Записан {out} ({len(lessons)} урока)")
@@ -0,0 +1,171 @@
+"""
+Бърз път за глобалните събития от колелцето и hover ефектите.
+
+  • ScrollDispatcher – един bind_all за цялото приложение. Кой уиджет да се
+    скролва се намира веднъж (нагоре по master веригата) и се кешира за
+    всеки уиджет под курсора. Поредица от събития (бърз trackpad) се събира
+    и се прилага като ЕДНО преместване на кадър, в пиксели, по желание плавно.
+  • bind_hover – Enter/Leave, които конфигурират бутона само при реална смяна
+    на състоянието.
+"""
+FRAME_MS = 16          # ~60 кадъра/сек
+PIXELS_PER_STEP = 48   # колко пиксела е едно „щракване“ на колелцето
+SMOOTH_FACTOR = 0.5    # дял от оставащото разстояние за кадър (1.0 = без анимация)
+
+HOVER_BG = "#d9d9d9"
+
+# <MouseWheel> – Win/macOS (и X11 при Tk ≥ 8.7); <Button-4>/<Button-5> – X11
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+def _is_scrollable(w):
+    """True, ако widget-ът има yview И зададен yscrollcommand („вързан“ скролбар)."""
+    try:
+        yc = w.cget("yscrollcommand")
+    except Exception:
+        return False
+    return hasattr(w, "yview") and yc not in (None, "", " ")
+
+
+class ScrollDispatcher:
+    def __init__(self, root, smooth=True):
+        self.root = root
+        self.smooth = smooth
+        self._targets = {}   # път на уиджет -> (уиджет, цел за скрол или None)
+        self._pending = {}   # цел -> оставащи пиксели
+        self._job = None
+        # event.delta за една стъпка: 120 (Windows; X11 от Tk 8.7 нататък), 1 (macOS)
+        self._units = {"aqua": 1}.get(root.tk.call("tk", "windowingsystem"), 120)
+
+        for seq in WHEEL_EVENTS:
+            root.bind_all(seq, self._on_wheel)
+
+    @classmethod
+    def install(cls, root, **kw):
+        """Връща диспечера на root-а (създава го веднъж за цялото приложение)."""
+        if getattr(root, "_scroll_dispatcher", None) is None:
+            root._scroll_dispatcher = cls(root, **kw)
+        return root._scroll_dispatcher
+
+    # ---------- РЕГИСТЪР: уиджет -> цел ----------
+    def register(self, widget, target=None):
+        """
+        Явно задава целта за widget (по подразбиране – самият той). Колелцето
+        върху него минава само през диспечера: класовите bindings (напр. на
+        Text) иначе биха скролвали втори път и без обединяване.
+        """
+        self._targets[str(widget)] = (widget, target or widget)
+        for seq in WHEEL_EVENTS:
+            widget.bind(seq, self._on_own_wheel, add="+")
+
+    def _on_own_wheel(self, e):
+        self._on_wheel(e)
+        return "break"  # спира и класовия binding, и bind_all
+
+    def _resolve(self, w):
+        """Целта за уиджета под курсора; кешира и всички минати родители."""
+        chain = []
+        target = None
+        while w is not None:
+            cached = self._targets.get(str(w))
+            if cached is not None and cached[0] is w:
+                target = cached[1]
+                break
+            chain.append(w)
+            if _is_scrollable(w):
+                target = w
+                break
+            w = getattr(w, "master", None)
+        for c in chain:
+            self._targets[str(c)] = (c, target)
+        if target is not None and not target.winfo_exists():
+            # Унищожен (напр. изхвърлен от LRU) → забравяме и търсим наново
+            for c in chain:
+                self._targets.pop(str(c), None)
+            return None
+        return target
+
+    def forget(self, widget):
+        """Маха всички записи за widget и децата му (при destroy на екран)."""
+        prefix = str(widget)
+        for key in [k for k in self._targets if k == prefix or k.startswith(prefix + ".")]:
+            del self._targets[key]
+
+    # ---------- КОЛЕЛЦЕ ----------
+    def _on_wheel(self, e):
+        x, y = self.root.winfo_pointerxy()
+        try:
+            w = self.root.winfo_containing(x, y)
+        except KeyError:  # вграден/чужд прозорец без Python обект
+            return
+        target = self._resolve(w) if w is not None else None
+        if target is None:
+            return
+
+        # Нормализираме посоката:
+        #  - Linux праща <Button-4> (up) и <Button-5> (down)
+        #  - Win/macOS (и X11 при Tk ≥ 8.7) пращат <MouseWheel> с event.delta (+/-)
+        if getattr(e, "num", None) in (4, 5):
+            steps = -1 if e.num == 4 else 1
+        else:
+            steps = -e.delta / self._units
+        self._pending[target] = self._pending.get(target, 0.0) + steps * PIXELS_PER_STEP
+        if self._job is None:
+            self._job = self.root.after(FRAME_MS, self._flush)
+
+    def _flush(self):
+        """Едно преместване на кадър за всяка цел (вместо по едно на събитие)."""
+        self._job = None
+        for target, remaining in list(self._pending.items()):
+            move = remaining * SMOOTH_FACTOR if self.smooth else remaining
+            if abs(remaining) <= 1 or abs(move) < 1:
+                move = remaining
+            self._scroll_pixels(target, move)
+            remaining -= move
+            if abs(remaining) < 0.5:
+                del self._pending[target]
+            else:
+                self._pending[target] = remaining
+        if self._pending:
+            self._job = self.root.after(FRAME_MS, self._flush)
+
+    def _scroll_pixels(self, target, px):
+        try:
+            if not target.winfo_exists():
+                return
+            if target.winfo_class() == "Text":
+                target.yview_scroll(int(round(px)), "pixels")
+                return
+            region = str(target.cget("scrollregion")).split()
+            if len(region) == 4:
+                total = float(region[3]) - float(region[1])
+                if total > 0:
+                    first = target.yview()[0]
+                    target.yview_moveto(min(1.0, max(0.0, first + px / total)))
+                    return
+            # Без scrollregion → стандартни units (поне една стъпка)
+            steps = int(px / PIXELS_PER_STEP) or (1 if px > 0 else -1)
+            target.yview_scroll(steps, "units")
+        except Exception:
+            self._pending.pop(target, None)
+
+
+# ---------- HOVER ----------
+def bind_hover(btn, base_bg, hover_bg=HOVER_BG):
+    """Сиво + ръчичка при задържане; config се вика само при смяна на състоянието."""
+    normal = dict(bg=base_bg, activebackground=base_bg, cursor="arrow")
+    hover = dict(bg=hover_bg, activebackground=hover_bg, cursor="hand2")
+    state = [False]  # True = в момента е в hover вид
+
+    def on_enter(_e):
+        if not state[0]:
+            state[0] = True
+            btn.config(**hover)
+
+    def on_leave(_e):
+        if state[0]:
+            state[0] = False
+            btn.config(**normal)
+
+    btn.bind("<Enter>", on_enter)
+    btn.bind("<Leave>", on_leave)
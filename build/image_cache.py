@@ -0,0 +1,191 @@
+"""
+Общ кеш за изображенията от assets/frame0.
+
+  • Ключ = (име на асета, целеви размер) → един PhotoImage за цялото приложение.
+    Всеки `get`/`get_async` брои един ползвател; `release` го връща и при
+    нула ползватели картинката се освобождава (напр. при изхвърлен урок).
+  • Четенето (и декодирането/смаляването, ако има Pillow) става в работна
+    нишка; готовият резултат се предава на Tk в главната нишка.
+  • По желание пази смалените копия на диска, за да не се декодират
+    пълноразмерните PNG-и при всяко стартиране.
+
+Декодирането извън главната нишка изисква Pillow (requirements.txt). Без
+него приложението работи, но работната нишка само чете байтовете, а Tk
+декодира всеки PNG (и го смалява със `subsample`) в главната нишка – т.е.
+стартирането не е по-бързо от преди.
+"""
+import queue
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from pathlib import Path
+from tkinter import PhotoImage
+
+try:
+    from PIL import Image, ImageTk
+except ImportError:  # Pillow не е задължителен
+    Image = ImageTk = None
+
+
+def png_size(path):
+    """Чете (ширина, височина) от IHDR на PNG файл, без да го декодира."""
+    with open(path, "rb") as fh:
+        head = fh.read(24)
+    if head[:8] != b"\x89PNG\r\n\x1a\n":
+        return None
+    return struct.unpack(">II", head[16:24])
+
+
+class ImageCache:
+    def __init__(self, root, assets_dir, disk_cache_dir=None, workers=2,
+                 poll_ms=15, profiler=None):
+        self.root = root
+        self.profiler = profiler  # StartupProfiler (по желание) за времената
+        self.assets_dir = Path(assets_dir)
+        self.disk_cache_dir = Path(disk_cache_dir) if disk_cache_dir else None
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=workers,
+                                        thread_name_prefix="img")
+        self._images = {}     # (name, size) -> PhotoImage
+        self._users = {}      # (name, size) -> брой ползватели (get/get_async - release)
+        self._futures = {}    # (name, size) -> Future с резултата от нишката
+        self._callbacks = {}  # (name, size) -> [callback(PhotoImage), ...]
+        self._done = queue.Queue()
+        self._polling = False
+
+    # ---------- РАБОТНА НИШКА (без Tk!) ----------
+    def _cached_path(self, name, size):
+        if self.disk_cache_dir is None or size is None:
+            return None
+        stem = Path(name).stem
+        return self.disk_cache_dir / f"{stem}_{size[0]}x{size[1]}.png"
+
+    def _load(self, name, size):
+        """Връща ("pil", Image) или ("bytes", PNG байтове, вече смалени ли са)."""
+        src = self.assets_dir / name
+        cached = self._cached_path(name, size)
+        if cached is not None and cached.exists() \
+                and cached.stat().st_mtime >= src.stat().st_mtime:
+            src, size = cached, None  # копието на диска вече е в нужния размер
+
+        if Image is not None:
+            im = Image.open(src)
+            im.load()
+            if size is not None:
+                im = im.convert("RGBA")
+                im.thumbnail(size)
+                if cached is not None:
+                    try:
+                        cached.parent.mkdir(parents=True, exist_ok=True)
+                        im.save(cached)
+                    except (OSError, ValueError) as e:  # кешът е по желание
+                        print(f"Неуспешен запис в кеша {cached}: {e}")
+            return ("pil", im)
+        return ("bytes", src.read_bytes(), size is None)
+
+    # ---------- ГЛАВНА НИШКА ----------
+    def _finish(self, key, result):
+        """Превръща резултата от нишката в PhotoImage (само в главната нишка)."""
+        name, size = key
+        if result[0] == "pil":
+            img = ImageTk.PhotoImage(result[1], master=self.root)
+        else:
+            _kind, data, scaled = result
+            img = PhotoImage(master=self.root, data=data)
+            if size is not None and not scaled:
+                factor = max(ceil(img.width() / size[0]),
+                             ceil(img.height() / size[1]))
+                if factor > 1:
+                    img = img.subsample(factor)
+                cached = self._cached_path(name, size)
+                if cached is not None:
+                    try:
+                        cached.parent.mkdir(parents=True, exist_ok=True)
+                        img.write(str(cached), format="png")
+                    except Exception as e:
+                        print(f"Неуспешен запис в кеша {cached}: {e}")
+        self._images[key] = img
+        return img
+
+    def prefetch(self, names, size=None):
+        """Пуска фоново зареждане; `get` после само довършва в главната нишка."""
+        for name in names:
+            key = (name, size)
+            if key not in self._images and key not in self._futures:
+                fut = self._pool.submit(self._load, name, size)
+                fut.add_done_callback(lambda _f, key=key: self._done.put(key))
+                self._futures[key] = fut
+
+    def get(self, name, size=None):
+        """Връща PhotoImage веднага (изчаква фоновото зареждане, ако тече)."""
+        key = (name, size)
+        self._acquire(key)
+        if key in self._images:
+            return self._images[key]
+        t0 = time.perf_counter()
+        fut = self._futures.pop(key, None)
+        result = fut.result() if fut is not None else self._load(name, size)
+        img = self._finish(key, result)
+        if self.profiler is not None:
+            self.profiler.record(f"decode {name}", t0, time.perf_counter())
+        self._notify(key, img)
+        return img
+
+    def get_async(self, name, callback, size=None):
+        """Вика `callback(PhotoImage)` в главната нишка, когато е готово."""
+        key = (name, size)
+        self._acquire(key)
+        if key in self._images:
+            callback(self._images[key])
+            return
+        self._callbacks.setdefault(key, []).append(callback)
+        self.prefetch([name], size)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _acquire(self, key):
+        self._users[key] = self._users.get(key, 0) + 1
+
+    def release(self, name, size=None):
+        """Ползвателят вече не държи картинката; последният я освобождава."""
+        key = (name, size)
+        left = self._users.get(key, 0) - 1
+        if left > 0:
+            self._users[key] = left
+            return
+        self._users.pop(key, None)
+        self._images.pop(key, None)
+
+    def _notify(self, key, img):
+        for cb in self._callbacks.pop(key, []):
+            cb(img)
+
+    def _poll(self):
+        """Прибира готовите резултати от нишките (Tk не е thread-safe)."""
+        while True:
+            try:
+                key = self._done.get_nowait()
+            except queue.Empty:
+                break
+            fut = self._futures.pop(key, None)
+            if fut is None:
+                continue  # вече довършено от `get`
+            waited = key in self._callbacks  # а не само prefetch
+            try:
+                img = self._finish(key, fut.result())
+            except Exception as e:
+                print(f"Неуспешно зареждане на {key[0]}: {e}")
+                self._callbacks.pop(key, None)
+                continue
+            self._notify(key, img)
+            if waited and key not in self._users:  # освободена, докато се зареждаше
+                self._images.pop(key, None)
+        if self._callbacks:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
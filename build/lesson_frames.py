@@ -0,0 +1,153 @@
+"""
+Мениджър на frame-овете за уроците.
+
+  • Предварително изгражда „вероятните следващи“ уроци на малки порции
+    в event loop-а на Tk (after_idle/after), за да може кликът само да покаже
+    готов frame.
+  • Пази най-много `max_frames` frame-а и/или `max_bytes` (приблизителна
+    памет); при превишаване изхвърля най-отдавна използвания (LRU).
+  • Отчита времето за изграждане на всеки урок и hit/miss за готовите frame-ове.
+"""
+import time
+from collections import OrderedDict
+
+
+class LessonFrameManager:
+    def __init__(self, root, build_fn, max_frames=4, max_bytes=None,
+                 slice_delay_ms=50):
+        """
+        `build_fn(n)` изгражда и връща (непакетиран) Frame за урок n.
+        `max_bytes` ползва `frame._cost_bytes`, ако builder-ът го е задал.
+        """
+        self.root = root
+        self.build_fn = build_fn
+        self.max_frames = max_frames
+        self.max_bytes = max_bytes
+        self.slice_delay_ms = slice_delay_ms
+
+        self.frames = OrderedDict()  # lesson_no -> Frame (последният = най-скоро ползван)
+        self.current = None          # урокът, който е показан в момента
+        self._queue = []             # уроци, чакащи предварително изграждане
+        self._job = None
+        self._prebuilt = set()       # изградени предварително, още непоказани
+
+        # ---- Статистика ----
+        self.build_ms = {}           # lesson_no -> време за изграждане (ms)
+        self.open_ms = {}            # lesson_no -> последно време за показване (ms)
+        self.hits = 0                # клик върху вече изграден frame
+        self.misses = 0              # клик, който е трябвало да изгради frame
+        self.prebuilt_hits = 0       # клик върху frame, изграден предварително
+        self.evictions = 0
+
+    # ---------- ИЗГРАЖДАНЕ ----------
+    def _build(self, n):
+        t0 = time.perf_counter()
+        fr = self.build_fn(n)
+        self.build_ms[n] = (time.perf_counter() - t0) * 1000
+        self.frames[n] = fr
+        self._evict(keep=n)
+        return fr
+
+    def get(self, n):
+        """Връща frame-а за урок n (изгражда го синхронно, ако липсва)."""
+        if n in self.frames:
+            self.hits += 1
+            if n in self._prebuilt:
+                self._prebuilt.discard(n)
+                self.prebuilt_hits += 1
+            self.frames.move_to_end(n)
+            return self.frames[n]
+        self.misses += 1
+        return self._build(n)
+
+    def show(self, n, **pack_opts):
+        """Показва урок n и засича колко време отнема самото показване."""
+        t0 = time.perf_counter()
+        fr = self.get(n)
+        fr.pack(**pack_opts)
+        self.current = n
+        self.open_ms[n] = (time.perf_counter() - t0) * 1000
+        return fr
+
+    def hide_all(self):
+        for fr in self.frames.values():
+            if fr.winfo_ismapped():
+                fr.pack_forget()
+        self.current = None
+
+    # ---------- ПРЕДВАРИТЕЛНО ИЗГРАЖДАНЕ (на порции в event loop-а) ----------
+    def prebuild(self, lessons):
+        """Нарежда уроците за изграждане при idle; по един урок на порция."""
+        for n in lessons:
+            if n not in self.frames and n not in self._queue:
+                self._queue.append(n)
+        if self._queue and self._job is None:
+            self._job = self.root.after_idle(self._step)
+
+    def _step(self):
+        self._job = None
+        while self._queue:
+            n = self._queue.pop(0)
+            if n not in self.frames:
+                self._build(n)
+                self._prebuilt.add(n)
+                break  # освобождаваме event loop-а преди следващия урок
+        if self._queue:
+            self._job = self.root.after(self.slice_delay_ms, self._step)
+
+    def discard(self, n):
+        """Унищожава готовия frame на урок n (следващото отваряне ще го изгради)."""
+        fr = self.frames.pop(n, None)
+        if fr is not None:
+            fr.destroy()
+            self._prebuilt.discard(n)
+
+    def cancel(self):
+        self._queue.clear()
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    # ---------- LRU ИЗХВЪРЛЯНЕ ----------
+    def _total_bytes(self):
+        return sum(getattr(fr, "_cost_bytes", 0) for fr in self.frames.values())
+
+    def _over_budget(self):
+        if self.max_frames is not None and len(self.frames) > self.max_frames:
+            return True
+        return self.max_bytes is not None and self._total_bytes() > self.max_bytes
+
+    def _evict(self, keep=None):
+        """Изхвърля най-старите frame-ове; показаният и `keep` (току-що изграденият) остават."""
+        while self._over_budget():
+            victim = next((n for n in self.frames if n not in (self.current, keep)), None)
+            if victim is None:
+                break
+            self.frames.pop(victim).destroy()
+            self._prebuilt.discard(victim)
+            self.evictions += 1
+
+    # ---------- ОТЧЕТ ----------
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "prebuilt_hits": self.prebuilt_hits,
+            "evictions": self.evictions,
+            "cached": list(self.frames),
+            "bytes": self._total_bytes(),
+            "build_ms": dict(self.build_ms),
+            "open_ms": dict(self.open_ms),
+        }
+
+    def report(self):
+        """Кратък текстов отчет (за конзолата)."""
+        lines = [f"Frames: hits={self.hits} (prebuilt {self.prebuilt_hits}) "
+                 f"misses={self.misses} "
+                 f"evictions={self.evictions} cached={list(self.frames)}"]
+        for n in sorted(self.build_ms):
+            opened = self.open_ms.get(n)
+            lines.append(
+                f"  Урок {n}: build {self.build_ms[n]:.1f} ms"
+                + (f", open {opened:.1f} ms" if opened is not None else ""))
+        return "\n".join(lines)
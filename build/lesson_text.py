@@ -0,0 +1,272 @@
+"""
+Виртуализиран рендер на текста на урок върху Canvas.
+
+Вместо по един Label за всеки ред, съдържанието се разбива ВЕДНЪЖ на
+стилизирани редове (заглавия, точки, номерирани стъпки, обикновен текст),
+а върху канваса се рисуват canvas-text елементи само за редовете около
+видимата част. Броят уиджети и времето за отваряне не зависят от дължината
+на урока.
+"""
+import re
+from math import ceil
+from tkinter import font as tkfont
+
+# ---------- ВИДОВЕ РЕДОВЕ ----------
+RUN_BLANK = "blank"
+RUN_HEADING = "hdr"
+RUN_BULLET = "bullet"
+RUN_STEP = "step"
+RUN_BODY = "body"
+
+BULLET_CHAR = "•"
+_STEP_RE = re.compile(r"^\d+[).]\s")
+
+# Стил за всеки вид ред: (шрифт, отстъп вляво в пиксели)
+RUN_STYLES = {
+    RUN_HEADING: (("Inter", 12, "bold", "underline"), 0),
+    RUN_BULLET: (("Inter", 12), 8),
+    RUN_STEP: (("Inter", 12), 8),
+    RUN_BODY: (("Inter", 12), 0),
+    RUN_BLANK: (("Inter", 12), 0),
+}
+LINE_PAD = 2  # вертикален отстъп между редовете (колкото при Label)
+# Примерен текст за средната ширина на знак (мери се веднъж за стил)
+GLYPH_SAMPLE = "Тестването на софтуер проверява изискванията. Software testing 2024."
+
+
+def parse_lesson(content_text, headings_set):
+    """Разбива текста на урока на списък от (вид, текст). Вика се веднъж за урок."""
+    runs = []
+    for raw in content_text.splitlines():
+        line = raw.rstrip()
+        s = line.strip()
+        if not s:
+            kind = RUN_BLANK
+        elif s in headings_set:
+            kind = RUN_HEADING
+        elif s.startswith(BULLET_CHAR):
+            kind = RUN_BULLET
+        elif _STEP_RE.match(s):
+            kind = RUN_STEP
+        else:
+            kind = RUN_BODY
+        runs.append((kind, line))
+    return runs
+
+
+class _HeightTree:
+    """
+    Fenwick дърво над височините на редовете: отместване на ред, ред по
+    отместване и корекция на една височина – всяко за O(log n).
+    """
+
+    def __init__(self, heights):
+        tree = [0] + list(heights)
+        n = len(heights)
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        self.tree = tree
+        self.total = sum(heights)
+
+    def add(self, i, delta):
+        self.total += delta
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """Сумата от височините на редове 0..i-1."""
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, offset):
+        """Най-големият брой начални редове с обща височина <= offset."""
+        pos, step = 0, 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= offset:
+                pos = nxt
+                offset -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+
+class LessonTextView:
+    """
+    Рисува редовете от `parse_lesson` върху съществуващ Canvas.
+
+    Височините се оценяват предварително по броя знаци × средната ширина на
+    знак (мери се веднъж за стил), а реалните canvas-text елементи се създават
+    само за редовете във viewport-а (+ запас `overscan` екрана нагоре/надолу).
+    Когато реален ред се окаже по-висок от оценката, корекцията влиза в
+    дърво на височините, изместват се само нарисуваните редове под него и се
+    вика `on_resize`.
+    """
+
+    TAG = "lesson_text"
+    HL_TAG = "lesson_hl"
+    HL_COLOR = "#FDE68A"
+
+    def __init__(self, cv, runs, x=20, y=16, width=900, fg="#0F172A",
+                 overscan=1.0, on_resize=None):
+        self.cv = cv
+        self.runs = runs
+        self.x, self.y, self.width = x, y, width
+        self.fg = fg
+        self.overscan = overscan
+        self.on_resize = on_resize
+        self.items = {}  # индекс на ред -> id на canvas елемента
+        self.highlights = {}  # индекс на ред -> id на фона за подчертаване
+        self.match_fn = None  # match_fn(text) -> bool; редовете за подчертаване
+        self._pending = None
+
+        # Метрики за всеки стил (веднъж): височина на ред и средна ширина на знак
+        self._line_h, self._glyph_w = {}, {}
+        for spec, _indent in RUN_STYLES.values():
+            if spec not in self._line_h:
+                f = tkfont.Font(root=cv, font=spec)
+                self._line_h[spec] = f.metrics("linespace") + LINE_PAD
+                self._glyph_w[spec] = f.measure(GLYPH_SAMPLE) / len(GLYPH_SAMPLE)
+
+        self._layout()
+
+    # ---------- ГЕОМЕТРИЯ ----------
+    def _layout(self):
+        """Оценява височината на всеки ред (без заявки към Tk) и строи дървото."""
+        self.heights = [self._estimate(kind, text) for kind, text in self.runs]
+        self._tree = _HeightTree(self.heights)
+
+    @property
+    def bottom(self):
+        return self.y + self._tree.total
+
+    def top(self, i):
+        """Канвас-координата y на горния край на ред i."""
+        return self.y + self._tree.prefix(i)
+
+    def set_width(self, width):
+        """Сменя ширината за пренасяне; реалните редове се рисуват наново."""
+        width = max(width, 100)
+        if width == self.width:
+            return False
+        self.width = width
+        self.cv.delete(self.TAG)
+        self.cv.delete(self.HL_TAG)
+        self.items.clear()
+        self.highlights.clear()
+        self._layout()
+        self.schedule()
+        return True
+
+    def _estimate(self, kind, text):
+        spec, indent = RUN_STYLES[kind]
+        line_h = self._line_h[spec]
+        if kind == RUN_BLANK:
+            return line_h
+        text_w = len(text) * self._glyph_w[spec]
+        return max(1, ceil(text_w / max(1, self.width - indent))) * line_h
+
+    def _shift_below(self, i, delta):
+        """Размества всичко под ред i с delta пиксела (след корекция на височина)."""
+        self.heights[i] += delta
+        self._tree.add(i, delta)
+        # Местим само нарисуваните редове; останалите четат top() от дървото
+        for j, item in self.items.items():
+            if j > i:
+                self.cv.move(item, 0, delta)
+        for j, item in self.highlights.items():
+            if j > i:
+                self.cv.move(item, 0, delta)
+
+    def index_at(self, y):
+        """Индекс на реда, който съдържа канвас-координата y."""
+        return min(self._tree.find(y - self.y), max(0, len(self.runs) - 1))
+
+    # ---------- РЕНДЕР ----------
+    def schedule(self):
+        """Обединява честите заявки (скрол/resize) в един рендер при idle."""
+        if self._pending is None:
+            self._pending = self.cv.after_idle(self.render)
+
+    def render(self):
+        """Създава редовете около видимата зона и трие тези далеч от нея."""
+        self._pending = None
+        if not self.runs:
+            return
+        cv = self.cv
+        view_h = max(cv.winfo_height(), 1)
+        top = cv.canvasy(0)
+        margin = view_h * self.overscan
+        first = self.index_at(top - margin)
+        last = self.index_at(top + view_h + margin)
+
+        for j in [j for j in self.items if j < first or j > last]:
+            cv.delete(self.items.pop(j))
+            if j in self.highlights:
+                cv.delete(self.highlights.pop(j))
+
+        resized = False
+        for i in range(first, last + 1):
+            if i in self.items:
+                continue
+            kind, text = self.runs[i]
+            if kind == RUN_BLANK:
+                continue
+            spec, indent = RUN_STYLES[kind]
+            item = cv.create_text(
+                self.x + indent, self.top(i), text=text, anchor="nw",
+                font=spec, fill=self.fg, width=self.width - indent,
+                tags=(self.TAG, f"p{i}")
+            )
+            self.items[i] = item
+            bbox = cv.bbox(item)
+            if bbox:
+                real_h = bbox[3] - bbox[1] + LINE_PAD
+                if real_h != self.heights[i]:
+                    self._shift_below(i, real_h - self.heights[i])
+                    resized = True
+            if self.match_fn is not None and self.match_fn(text):
+                self._highlight(i, item)
+
+        if resized and self.on_resize:
+            self.on_resize()
+
+    # ---------- ПОДЧЕРТАВАНЕ И ПРЕВЪРТАНЕ (за търсенето) ----------
+    def _highlight(self, i, item):
+        bbox = self.cv.bbox(item)
+        if not bbox:
+            return
+        x1, y1, x2, y2 = bbox
+        rect = self.cv.create_rectangle(x1 - 3, y1 - 1, x2 + 3, y2 + 1,
+                                        fill=self.HL_COLOR, outline="",
+                                        tags=(self.HL_TAG,))
+        self.cv.tag_lower(rect, item)
+        self.highlights[i] = rect
+
+    def set_highlight(self, match_fn):
+        """
+        Подчертава редовете, за които match_fn(text) е True. Проверяват се само
+        нарисуваните (видимите) редове; останалите – когато влязат във viewport-а.
+        """
+        self.match_fn = match_fn
+        self.cv.delete(self.HL_TAG)
+        self.highlights.clear()
+        if match_fn is None:
+            return
+        for i, item in self.items.items():
+            if match_fn(self.runs[i][1]):
+                self._highlight(i, item)
+
+    def scroll_to(self, i, margin=40):
+        """Превърта канваса така, че ред i да е близо до горния край."""
+        region = self.cv.cget("scrollregion").split()
+        total = float(region[3]) if len(region) == 4 else self.bottom
+        if total > 0 and 0 <= i < len(self.runs):
+            self.cv.yview_moveto(max(0.0, (self.top(i) - margin) / total))
+        self.schedule()
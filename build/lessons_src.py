@@ -0,0 +1,499 @@
+"""
+Изходни данни за уроците (текст, секции, въпроси, снимки).
+
+Не се импортира от gui.py при стартиране: `content_pack.py` го компилира
+в пакет (lessons.qapack), от който приложението чете само нужния урок.
+След промяна тук пусни `python content_pack.py`, за да провериш и
+прекомпилираш пакета (gui.py го прави и сам, ако пакетът е по-стар).
+"""
+
+# ---------- ДАННИ ЗА УРОЦИТЕ (текст, секции и въпроси) ----------
+LESSON_1_CONTENT = """
+Какво е тестване на софтуер?
+• Процес за оценка дали продуктът отговаря на изискванията/очакванията и за откриване на дефекти преди продукшън.
+
+Защо е важно?
+• Намалява риска и цената от дефекти след пускане.
+• Повишава надеждността и доверието в продукта.
+• Подпомага решенията (release/no release).
+
+Нива на тестване:
+1) Unit – малки части (функции/класове). Бързи, изолирани.
+2) Integration – взаимодействие между модули (БД, услуги).
+3) System / End-to-End – поведение на цялата система.
+4) Acceptance (UAT) – покриване на бизнес изисквания.
+
+Типове тестове:
+• Функционални: проверки по спецификация.
+• Нефункционални: производителност, сигурност, използваемост.
+• Smoke: бързи проверки на критичните пътеки.
+• Regression: уверяваме се, че старото поведение не е счупено.
+• Sanity: фокусирани проверки след малки промени.
+
+Жизнен цикъл на дефекта:
+New → Assigned → In Progress → Fixed → Retest → Verified → Closed (или Reopened)
+• Severity (тежест): колко силно влияе на системата.
+• Priority (приоритет): колко спешно трябва да се оправи.
+
+Състав на добър тест-кейс:
+• ID/Заглавие, Предусловия, Стъпки, Очакван резултат, Данни.
+Пример (Login – позитивен):
+1) Отвори страницата за вход.
+2) Въведи валидни имейл и парола.
+3) Натисни „Вход“.
+Очаквано: Пренасочване към таблото; вижда се името на потребителя.
+"""
+LESSON_1_HEADINGS = {
+    "Какво е тестване на софтуер?",
+    "Защо е важно?",
+    "Нива на тестване:",
+    "Типове тестове:",
+    "Жизнен цикъл на дефекта:",
+    "Състав на добър тест-кейс:",
+}
+LESSON_1_QUIZ = [
+    ("Основната цел на тестването е:", [
+        "Да ускори разработката на интерфейса",
+        "Да замени бизнес анализа",
+        "Да оцени покриването на изискванията и да открие дефекти преди продукшън",
+        "Да намали броя на разработчиците"
+    ], 2),
+    ("Правилен ред на нива на тестване (от ниско към високо):", [
+        "Integration → Unit → Acceptance → System",
+        "Unit → Integration → System/E2E → Acceptance",
+        "Acceptance → System/E2E → Integration → Unit",
+        "Unit → System/E2E → Integration → Acceptance"
+    ], 1),
+    ("Smoke тестовете са:", [
+        "Пълни регресии върху всички модули",
+        "Бързи проверки на критичните пътеки",
+        "Само нефункционални тестове",
+        "Само тестове на база данни"
+    ], 1),
+    ("Severity vs Priority означава:", [
+        "Severity = спешност, Priority = влияние",
+        "Severity = влияние; Priority = спешност за поправка",
+        "И двете значат едно и също",
+        "Priority е само за дизайнерски дефекти"
+    ], 1),
+    ("Задължителни елементи на добър тест-кейс са:", [
+        "Име на разработчика и версия на ОС",
+        "Скриптове за деплой",
+        "Предусловия, стъпки и очакван резултат",
+        "Диаграма на класовете"
+    ], 2),
+]
+
+LESSON_2_CONTENT = """
+Какво ще научиш:
+• Кои техники за проектиране на тестове да ползваш според вида входове и бизнес логика.
+• Как да намалиш броя тест-кейсове без да губиш покритие и как да приоритизираш.
+• Как да комбинираш техники (EP + BVA, Pairwise + граници) за максимална полза.
+• Как да документираш решенията си накратко и проследимо.
+
+Еквивалентно разделяне (Equivalence Partitioning):
+• Раздели входовете в валидни/невалидни класове; избери представител(и) от всеки клас.
+• Намалява прегледа от „всички стойности“ до „смислени представители“.
+• Включи класове като празна стойност, NULL, специални символи/локали (ако е текст).
+• Пример „възраст“ 18–65: класове <18, 18–65 (валидни), >65; тествай по 1–2 представители.
+
+Гранични стойности (Boundary Value Analysis):
+• Тестваме min−1, min, min+1 и max−1, max, max+1 (off-by-one грешки са чести).
+• Уточни дали границите са включени/изключени; отрази го в тестовете.
+• Освен числа — прилагай и за дължини на полета, дати/часове, суми по кошница.
+• Комбинирай с EP: покрий границите във всеки валиден/невалиден клас.
+
+Таблици на решенията (Decision Tables):
+• Полезни при много правила/условия → изгради матрица Условия × Действия.
+• Покрий уникални комбинации; обедини редове с еднакъв изход (където е коректно).
+• Добави ред „по подразбиране/else“, за да валидираш липсващи правила.
+• Пример: отстъпки по клиентски сегмент × метод на плащане × сезон (валидна/невалидна комбинация).
+
+Преходи на състояния (State Transition Testing):
+• Идентифицирай състояния, събития и позволени/забранени преходи.
+• Тествай невалидни събития в дадено състояние (очаквана грешка/игнориране).
+• Покрий и броячи/таймаути (напр. заключване след N опита, автоматично отключване след T мин).
+• Пример: Login → (3 грешни опита) → Locked → (изтича време/админ отключва) → Active.
+
+Комбинаторно (Pairwise/All-pairs):
+• Pairwise (t=2) гарантира, че всяка двойка стойности се среща поне веднъж → малко тестове, добро покритие.
+• Дефинирай ограничения (constraints), за да изключиш невъзможни комбинации.
+• „Seed“-ни критични сценарии ръчно, после допълни с pairwise генератор.
+• При нужда повиши силата до t=3 за чувствителни зони (повече покритие, повече тестове).
+
+Изследователско тестване (Exploratory):
+• Определи „чартър“ (цел), timebox (30–60 мин) и рискове/хипотези за атака.
+• Води кратки бележки: какво пробва, какво очакваше/наблюдава, дефекти/подозрения.
+• Ползвай „турове“ (data tour, interface tour, error tour) за систематично покритие.
+• Завърши с кратък дебриф: открития, следващи стъпки, идеи за автоматизация.
+
+Практически съвети:
+• Комбинирай техники: EP за класове, BVA за точките в/край класовете, Pairwise за параметри.
+• Стартирай от най-рисковите/критични потоци; автоматизирай стабилните сценарии.
+• Поддържай тестовете кратки, независими и проследими (ID → изискване/правило).
+"""
+LESSON_2_HEADINGS = {
+    "Какво ще научиш:",
+    "Еквивалентно разделяне (Equivalence Partitioning):",
+    "Гранични стойности (Boundary Value Analysis):",
+    "Таблици на решенията (Decision Tables):",
+    "Преходи на състояния (State Transition Testing):",
+    "Комбинаторно (Pairwise/All-pairs):",
+    "Изследователско тестване (Exploratory):",
+    "Практически съвети:",
+}
+LESSON_2_QUIZ = [
+    ("Еквивалентно разделяне означава:", [
+        "Да тестваш всички възможни стойности",
+        "Да избереш по един представител от всеки клас",
+        "Само граничните стойности",
+        "Случайни стойности"
+    ], 1),
+    ("Кои са добри гранични тестове за валиден диапазон 18–65 (вкл.)?", [
+        "18 и 65",
+        "17, 18, 19 и 64, 65, 66",
+        "16 и 66",
+        "Само 18 и 65 по веднъж"
+    ], 1),
+    ("Кога използваме таблици на решенията?", [
+        "Когато има много комбинации от условия и действия",
+        "Когато има само едно поле с число",
+        "Когато няма бизнес правила",
+        "Когато избираме цветове на UI"
+    ], 0),
+    ("Фокус при тестване на преходи на състояния:", [
+        "Разрешени и забранени преходи между състояния",
+        "Само цветове и подредба на екрана",
+        "Типове данни и сериализация",
+        "SQL оптимизация"
+    ], 0),
+    ("Основно предимство на pairwise:", [
+        "Тества всички комбинации от стойности",
+        "С малко тестове покрива всички двойки стойности",
+        "Използва се само за сигурност",
+        "Подходящо е само за производителност"
+    ], 1),
+]
+
+LESSON_3_CONTENT = """
+Какво ще научиш:
+• Как се правят тестова стратегия и тестов план (scope, подход, рискове).
+• Как се осигуряват среди/данни и как се планира капацитет.
+• Как се докладват дефекти и какви метрики следим.
+
+Тестова стратегия vs. тестов план:
+• Стратегия = high-level насоки (какво, защо, подходи, рискове, инструменти).
+• План = конкретика за релийз/проект (обхват, екип, график, вход/изход критерии).
+• Включи рискове и предположения; дефинирай out of scope.
+• Определи критерии за готовност (Entry) и приемане (Exit/Done).
+
+Матрица за проследяване на изискванията (RTM):
+• Свързва изисквания → тест-кейсове → дефекти → статути (проследимост).
+• Помага да видиш непокрити изисквания или „сиротни“ тестове.
+• Ползвай уникални ID-та и линкове към артефакти/тикети.
+• Обновявай след всяка промяна на изискванията.
+
+Оценка на усилие и график:
+• Оцени по сложност/обем, риск и автоматизируемост.
+• Планирай buffer за регресии и фиксове; синхронизирай с релийз влакове.
+• Разпределяй по умения (API/UI/мобилно/данни), предвиди code freeze.
+• Воденето на burn-down/percent complete помага за статуса.
+
+Метрики и докладване:
+• Покритие (by req/код), pass/fail, дефекти по тежест/приоритет.
+• Defect leakage/escape (колко са минали към по-късен етап/продукшън).
+• Mean Time to Detect/Fix, фуния на дефектите по етапи.
+• Кратък репорт: какво тествахме, какво не, рискове, препоръка за релийз.
+
+Дефект репорт (Bug Report):
+• Полета: Заглавие, Описание, Стъпки, Очаквано/Реално, Среда/версия, Приложения.
+• Severity (влияние) и Priority (спешност) – подбирай обективно.
+• Възпроизводимост и минимални стъпки → по-бърз фикс.
+• Добави логове/скрийншотове; свържи към тест-кейс/изискване.
+
+Добри практики:
+• Кратки и ясни тестове; независими, повтаряеми, с реалистични данни.
+• Избягвай „flake“ – стабилизирай среди/данни, reset след тест.
+• Автоматизирай критични регресии; ръчни проверки за UX/edge случаи.
+• Седмичен sync с екипа: статус, блокери, рискове, следващи стъпки.
+"""
+LESSON_3_HEADINGS = {
+    "Какво ще научиш:",
+    "Тестова стратегия vs. тестов план:",
+    "Матрица за проследяване на изискванията (RTM):",
+    "Оценка на усилие и график:",
+    "Метрики и докладване:",
+    "Дефект репорт (Bug Report):",
+    "Добри практики:",
+}
+LESSON_3_QUIZ = [
+    ("Разлика между стратегия и план е най-добре описана като:", [
+        "Стратегия = конкретни дати; План = общи насоки",
+        "Стратегия = общи насоки и подход; План = конкретика за релийз/проект",
+        "Няма разлика, синоними са",
+        "Стратегия е само за автоматизация"
+    ], 1),
+    ("Кое НЕ е типично поле в добър дефект репорт?", [
+        "Очакван резултат", "Реален резултат", "Любим цвят на тестера", "Стъпки за възпроизвеждане"
+    ], 2),
+    ("RTM служи, за да:", [
+        "Оптимизира скоростта на база данни", "Измерва само производителност",
+        "Управлява CI/CD пайплайна", "Проследява покритието на изисквания от тестове и дефекти"
+    ], 3),
+    ("Кои три метрики са полезни в статуса на тестване?", [
+        "Брой тестери, брой джира филтри, любим IDE",
+        "Pass/Fail, дефекти по тежест, defect leakage",
+        "Само брой тест-кейсове", "Само време за билд"
+    ], 1),
+    ("Severity и Priority означават:", [
+        "Severity = влияние върху системата; Priority = спешност за поправка",
+        "Severity = спешност; Priority = влияние", "Едно и също", "Priority само за production дефекти"
+    ], 0),
+]
+
+LESSON_4_CONTENT = """
+Какво ще научиш:
+• Как работят HTTP/REST и какво тестваме при API.
+• Разлика между методи, статуси, заглавия, тяло и как влияят на тестовете.
+• Идемпотентност/безопасност, позитивни/негативни сценарии, устойчивост.
+• Пагинация/сортиране/филтри, контракт (OpenAPI/JSON Schema), основи на сигурността.
+
+HTTP основи:
+• Ресурси (URI), методи: GET/POST/PUT/PATCH/DELETE, заглавия (Content-Type, Accept, Authorization).
+• Тяло обикновено JSON; кодиране/локал; дата/час формати (ISO 8601), номера/десетични.
+• Идентификатори в path vs. query (resource/{id} vs ?filter=…).
+
+Статус кодове:
+• 2xx успех (200 OK, 201 Created, 204 No Content).
+• 4xx клиентска грешка (400, 401, 403, 404, 409, 422, 429).
+• 5xx сървърна грешка (500, 503) – не издавай вътрешни подробности.
+• Консистентна структура на грешка: { code, message, details? }.
+
+Идемпотентност и безопасност:
+• Safe: GET/HEAD/OPTIONS не променят състояние.
+• Idempotent: GET/PUT/DELETE/HEAD/OPTIONS (POST/ PATCH не са по дефиниция).
+• Повторения/timeout-и → Idempotency-Key за POST, exponential backoff.
+
+Дизайн на тестове:
+• Позитивни + негативни сценарии (липсващи/грешни полета, типове, граници, невалиден JSON).
+• Проверявай заглавия (Content-Type, кеш), кодировка, големи payload-и, специални символи.
+• Конкурентност/повторения: дублиран POST, паралелни PUT/DELETE.
+
+Контракт/схема:
+• Валидирай срещу OpenAPI/JSON Schema (типове, required, enum, patterns).
+• Внимавай за компатибилност при версии; schema drift = счупени клиенти.
+
+Пагинация, филтър, сортиране:
+• offset/limit или cursor; max limit и дефолт.
+• Стабилно сортиране → без дубли/липси между страници; next/prev линкове.
+• Валидирай гранични стойности (page=0, limit<0, огромен limit).
+
+Грешки и устойчивост:
+• Таймаути, 5xx, мрежови грешки → коректни таймаути и ретраи.
+• Разлика 422 (валидация) vs 409 (конфликт) vs 400 (лошо искане).
+
+Сигурност (основи):
+• Auth vs Authz, токени/scope/изтичане; не изтичай чувствителни данни в грешки.
+• Rate limit, защита от груба сила; CORS (ако е публичен API).
+
+Практика:
+• Инструменти: curl/Postman/HTTPie; среди/колекции/променливи.
+• Автоматизация: smoke за критични крайни точки; schema validation в CI.
+"""
+LESSON_4_HEADINGS = {
+    "Какво ще научиш:", "HTTP основи:", "Статус кодове:", "Идемпотентност и безопасност:",
+    "Дизайн на тестове:", "Контракт/схема:", "Пагинация, филтър, сортиране:",
+    "Грешки и устойчивост:", "Сигурност (основи):", "Практика:",
+}
+LESSON_4_QUIZ = [
+    ("Кой метод НЕ е идемпотентен по дефиниция?",
+     ["GET", "PUT", "POST", "DELETE"], 2),
+    ("Кога е подходящо да върнем 201 Created?", [
+        "При успешно създаване на ресурс чрез POST", "При успешен GET на списък",
+        "Когато потребителят няма права", "При вътрешна грешка на сървъра"
+    ], 0),
+    ("Кое е добър пример за негативен тест?", [
+        "Валиден токен и очакван 200", "Невалидна схема/тип на поле → 422",
+        "GET на съществуващ ресурс → 200", "POST с валидни данни → 201"
+    ], 1),
+    ("Кое твърдение за пагинация е вярно?", [
+        "Не е нужно да валидираме limit",
+        "Трябва стабилно сортиране, за да няма дубли/липси между страници",
+        "page=0 винаги е валиден", "next/prev линкове са излишни"
+    ], 1),
+    ("Как да избегнем дублирано създаване при повторен POST?", [
+        "Idempotency-Key + backoff", "Да повторим заявката без промени",
+        "Да изтрием ресурса след всяка заявка", "Да използваме само GET"
+    ], 0),
+]
+
+LESSON_5_CONTENT = """
+Какво ще научиш:
+• Как да избираш стабилни локатори и да намалиш „flake“ тестовете.
+• Кога да използваш явни изчаквания и как да синхронизираш стъпките.
+• Как да структурираш UI тестове (Page Object/Screenplay) и да поддържаш код.
+• Основи на визуални проверки, крос-браузър/резолюции и достъпност (a11y).
+
+Локатори:
+• Предпочитай стабилни атрибути (data-test-id/role/name) пред крехки XPath-ове.
+• Избягвай :nth-child/абсолютен XPath по индекс; чупят се при малки промени.
+• Използвай ARIA role/name/label за по-устойчиви селектори и по-добра достъпност.
+• Централизирай селекторите (Page Object) – лесна подмяна при промяна на UI.
+
+Синхронизация и стабилност:
+• Явни изчаквания за условие (елемент видим/кликаем, мрежа тиха) > фиксиран sleep.
+• Минимизирай implicit wait; комбинирай retry/backoff за нестабилни действия.
+• Изолирай тестовете: чисти cookies/storage, reset състояние, фиксирай test data.
+• Стартирай в „headless“ и „headed“ режими при нужда; логвай снимки/видео при грешка.
+
+Архитектура на тестовете (POM/Screenplay):
+• Page Object: методи за действия + селектори на едно място → по-малко дублиране.
+• Screenplay: актьори/задачи/въпроси → добра композиция за сложни сценарии.
+• DRY: helper-и за често срещани стъпки (login, навигация, запълване на форми).
+• Поддържай ясни данни/фикстури; избягвай зависимости между тестовете.
+
+Визуални проверки:
+• Snapshot/visual diff за ключови екрани; контролирай динамични региони (mask).
+• Тествай различни теми/локали/OS шрифтове; настрой прагове за толеранс.
+• Комбинирай визуални с функционални проверки (не разчитай само на снимка).
+
+Крос-браузър/резолюции:
+• Смеси от браузъри и размери (desktop/tablet/mobile breakpoints).
+• Стабилно сортиране на тестовете и паралелизация; ограничение на брой успоредни сесии.
+• Фокус върху критични сценарии; не дублирай без нужда същите тестове навсякъде.
+
+Достъпност (a11y):
+• Проверявай role/name/label и tab навигация; контраст и фокус-видимост.
+• Alt/aria-label за значими елементи; без keyboard trap.
+• Интегрирай бърз a11y линтер/плъгин в CI и smoke.
+
+Най-чести проблеми и решения:
+• Flaky кликове → по-добри локатори + explicit wait + scroll-into-view.
+• Бавни тестове → споделени фикстури, по-малко E2E, повече component/contract.
+• Нестабилни среди → mock/stub за външни услуги, seed-нати данни, идемпотентни бекове.
+
+Практика:
+• Инструменти: Playwright/Cypress/Webdriver; репорти + скрийншоти в CI.
+• UI пирамида: малко E2E, повече компонентни/интеграционни → по-бързи обратни връзки.
+"""
+LESSON_5_HEADINGS = {
+    "Какво ще научиш:",
+    "Локатори:",
+    "Синхронизация и стабилност:",
+    "Архитектура на тестовете (POM/Screenplay):",
+    "Визуални проверки:",
+    "Крос-браузър/резолюции:",
+    "Достъпност (a11y):",
+    "Най-чести проблеми и решения:",
+    "Практика:",
+}
+LESSON_5_QUIZ = [
+    ("Кой локатор е най-стабилен за UI тест?", [
+        "Абсолютен XPath по индекс", "data-test-id / role+name",
+        "CSS :nth-child селектор", "Търсене по видим текст без role"
+    ], 1),
+    ("Кое е вярно за синхронизацията?", [
+        "Фиксиран sleep е за предпочитане", "Implicit wait решава всички проблеми",
+        "Explicit wait за конкретно условие е за предпочитане", "Не е нужна"
+    ], 2),
+    ("Основно предимство на Page Object е:", [
+        "Кодът става по-дълъг", "Селектори и действия са капсулирани и преизползваеми",
+        "Тестване без браузър", "Премахва нуждата от изчаквания"
+    ], 1),
+    ("Визуалните тестове са полезни за:", [
+        "Производителност", "UI регресии (snapshot/diff)", "Валидиране на API", "Покритие на код"
+    ], 1),
+    ("Кое намалява flakiness най-много?", [
+        "Паралелни кликове без изчакване",
+        "Стабилни локатори + explicit waits + reset на състоянието",
+        "Зависимости между тестовете", "Случайни паузи"
+    ], 1),
+]
+
+LESSON_6_CONTENT = """
+Какво ще научиш:
+• Основни понятия: латентност, пропускателност (throughput), едновременност (concurrency), опашка.
+• Как се проектира товар: ramp-up/steady/soak/spike/stress и кога се използват.
+• Кои метрики следим (p95/p99, грешки, наситеност на ресурси) и как определяме SLA/SLO.
+• Как да четем резултати и да намираме тесни места (база данни, мрежа, код).
+
+Основни понятия и цели:
+• Латентност = време за отговор; throughput = заявки/сек; concurrency = активни едновременни потребители/заявки.
+• Цели/критерии: напр. p95 < 300 ms, грешки < 1%, CPU/Memory/IO < 80% в steady state.
+• Опашки/бекпрешър: при наситеност расте опашка → латентност скача → контролирай с лимити и graceful отказ.
+
+Проектиране на товар:
+• Ramp-up: постепенно повишаване до целевия товар; избягва фалшиви пикове.
+• Steady/state: стабилен сегмент за измерване; Soak (дълъг) за течове/устойчивост.
+• Spike/Stress: внезапни скокове/над целта за устойчивост и лимити.
+• Модел: потребители vs RPS; мисли за „think time“, реалистично разпределение и корелация.
+
+Метрики и наблюдение:
+• Персентили p95/p99 са по-показателни за „опашката“ от средното/медиана.
+• Грешки по тип (4xx/5xx/timeout); saturation: CPU, памет, дисков/мрежов IO, connection pools.
+• Вътрешни тайминги: DNS/TLS/време за заявка към БД/кеш; логове с корелационни ID.
+• Внимавай за „coordinated omission“ – клиентът да не маскира латентности при блокиране.
+
+Сценарии за изпитване:
+• Позитивни/негативни; реални данни/разпределения; payload размери.
+• Пагинация/филтри/сортиране; качване/сваляне на файлове; burst-и.
+• Ретраи/бекоф; лимити/котви (rate limit, circuit breaker) и очаквано поведение.
+
+Среди и данни:
+• Среда, близка до продукшън (конфигурации, размери); затопляне (warm-up) и кеши.
+• Стабилни тестови данни и изолация; seed/cleanup; фиксирани версии на зависимости.
+• Контрол на вариацията: повтаряемост, същия build, същите параметри.
+
+Диагностика и типични тесни места:
+• БД: липсващи индекси, N+1, бавни заявки, блокировки/дедлоки.
+• Мрежа: TLS handshakes, връзки, MTU/packet loss, head-of-line blocking.
+• Приложение: GC паузи, синхронизации/локове, сериен код на горещ път.
+• Кешове/CDN: нисък hit ratio, неправилно инвалидиране.
+
+Добри практики:
+• Определи вход/изход критерии; дефинирай стоп условия (SLA нарушено, грешки↑).
+• Сравнявай спрямо baseline; събирай артефакти (графики, лога, конфиги).
+• Малко E2E под голям товар; повече компонент/contract тестове за локализиране.
+• Автоматизирай smoke performance в CI; периодични soak/stress извън пикови часове.
+
+Практика:
+• Инструменти: k6/JMeter/Gatling/Locust; репорти и експорти към Grafana/Influx/Prometheus.
+• Скриптове с параметри (данни, RPS, продължителност); шаблон за доклад и шаблон за сравнение на рунове.
+"""
+LESSON_6_HEADINGS = {
+    "Какво ще научиш:", "Основни понятия и цели:", "Проектиране на товар:",
+    "Метрики и наблюдение:", "Сценарии за изпитване:", "Среди и данни:",
+    "Диагностика и типични тесни места:", "Добри практики:", "Практика:",
+}
+LESSON_6_QUIZ = [
+    ("Кой показател е най-полезен за „опашката“ на латентността?", [
+        "Средно време (avg)", "Медиана (p50)", "Персентили p95/p99", "Минимално време"
+    ], 2),
+    ("Кое описва правилно ramp-up при натоварване?", [
+        "Започваме веднага с максимален товар", "Постепенно увеличаваме до целевия товар",
+        "Поддържаме постоянен товар без промяна", "Намаляваме товара към края"
+    ], 1),
+    ("Кое твърдение е вярно за throughput и concurrency?", [
+        "Throughput = едновременни потребители", "Concurrency = заявки/сек",
+        "Throughput = заявки/сек, Concurrency = едновременни активни", "Едно и също са"
+    ], 2),
+    ("Кое е смислено стоп условие за теста?", [
+        "Когато дизайнерът одобри цветовете",
+        "p95 под целта, грешки < 1%, ресурси < 80% устойчиво",
+        "CPU удари 100% за 1 секунда", "Има поне 10 заявки в лога"
+    ], 1),
+    ("Кое е типично тясно място?", [
+        "Липсващи индекси/бавни заявки в БД", "Използване на CDN",
+        "Логване на грешки", "Събиране на метрики"
+    ], 0),
+]
+
+# Събираме всичко в един речник: lesson_no -> (title, content, headings, quiz, снимки (optional) )
+lessons_data = {
+    1: ("Урок 1: Въведение в тестването на софтуер", LESSON_1_CONTENT, LESSON_1_HEADINGS, LESSON_1_QUIZ, ["lesson1_1.png"]),
+    2: ("Урок 2: Техники за проектиране на тестове", LESSON_2_CONTENT, LESSON_2_HEADINGS, LESSON_2_QUIZ, ["lesson2_1.png", "lesson2_2.png"]),
+    3: ("Урок 3: Планиране на тестове и управление на дефекти", LESSON_3_CONTENT, LESSON_3_HEADINGS, LESSON_3_QUIZ, ["lesson3_1.png", "lesson3_2.png"]),
+    4: ("Урок 4: API тестване – основи", LESSON_4_CONTENT, LESSON_4_HEADINGS, LESSON_4_QUIZ, ["lesson4_1.png", "lesson4_2.png"]),
+    5: ("Урок 5: Тестване на UI – локатори, стабилност и синхронизация", LESSON_5_CONTENT, LESSON_5_HEADINGS, LESSON_5_QUIZ, ["lesson5_1.png", "lesson5_2.png"]),
+    6: ("Урок 6: Натоварване и производителност – основи", LESSON_6_CONTENT, LESSON_6_HEADINGS, LESSON_6_QUIZ, ["lesson6_1.png", "lesson6_2.png"]),
+}
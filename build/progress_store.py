@@ -0,0 +1,136 @@
+"""
+Локално хранилище за прогреса (SQLite).
+
+  • `record_attempt` само слага опита в опашка – записът е във фонова нишка,
+    на партиди (по `batch_size` или на всеки `flush_ms`), в една транзакция.
+  • Четенето (`lesson_summary`, `question_stats`) е през отделна връзка с
+    агрегатни заявки върху индексирани колони; WAL режимът позволява четене,
+    докато нишката пише.
+"""
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id          INTEGER PRIMARY KEY,
+    lesson      INTEGER NOT NULL,
+    started_at  REAL    NOT NULL,
+    duration_s  REAL    NOT NULL,
+    score       INTEGER NOT NULL,
+    total       INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    attempt_id  INTEGER NOT NULL REFERENCES attempts(id),
+    lesson      INTEGER NOT NULL,
+    question    TEXT    NOT NULL,
+    topic       TEXT    NOT NULL DEFAULT '',
+    chosen      INTEGER NOT NULL,
+    correct     INTEGER NOT NULL
+);
+-- покриващ индекс за lesson_summary (заявката не чете самата таблица)
+CREATE INDEX IF NOT EXISTS ix_attempts_lesson ON attempts(lesson, score, total, duration_s);
+CREATE INDEX IF NOT EXISTS ix_answers_question ON answers(lesson, question, correct);
+"""
+
+_STOP = object()
+
+
+class ProgressStore:
+    def __init__(self, path, batch_size=200, flush_ms=500):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_s = flush_ms / 1000
+
+        # Схемата се създава синхронно (веднъж), после пише само нишката
+        with sqlite3.connect(self.path) as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+        self._reader = sqlite3.connect(self.path, check_same_thread=False)
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._run, name="progress-writer",
+                                        daemon=True)
+        self._writer.start()
+
+    # ---------- ЗАПИС (без блокиране на главната нишка) ----------
+    def record_attempt(self, lesson, bank, duration_s, started_at=None):
+        """Слага опита (QuizBank с отговорите) в опашката за запис."""
+        hits = bank.hits()
+        answers = [
+            (lesson, bank.texts[i], bank.topics[bank.topic_ids[i]],
+             bank.answers[i], hits[i])
+            for i in range(len(bank))
+        ]
+        started_at = started_at if started_at is not None else time.time() - duration_s
+        self._queue.put((lesson, started_at, duration_s, sum(hits), len(bank), answers))
+
+    def _run(self):
+        db = sqlite3.connect(self.path)
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self.flush_s)
+            except queue.Empty:
+                continue
+            batch = []
+            deadline = time.monotonic() + self.flush_s
+            # Събираме партида: до batch_size опита или до изтичане на flush_ms
+            while item is not _STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            else:
+                stop = True
+            if batch:
+                self._write(db, batch)
+        db.close()
+
+    def _write(self, db, batch):
+        try:
+            with db:  # една транзакция за цялата партида
+                for lesson, started_at, duration_s, score, total, answers in batch:
+                    cur = db.execute(
+                        "INSERT INTO attempts(lesson, started_at, duration_s, score, total)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (lesson, started_at, duration_s, score, total))
+                    attempt_id = cur.lastrowid
+                    db.executemany(
+                        "INSERT INTO answers(attempt_id, lesson, question, topic, chosen, correct)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        [(attempt_id, *a) for a in answers])
+        except sqlite3.Error as e:
+            print(f"Неуспешен запис на прогреса ({len(batch)} опита): {e}")
+
+    def close(self):
+        """Записва чакащото и спира нишката (вика се при затваряне на прозореца)."""
+        self._queue.put(_STOP)
+        self._writer.join(timeout=5)
+        self._reader.close()
+
+    # ---------- ЧЕТЕНЕ ----------
+    def lesson_summary(self):
+        """{lesson: {"attempts", "best_pct", "avg_pct", "time_s"}} – по един ред на урок."""
+        rows = self._reader.execute(
+            "SELECT lesson, COUNT(*), MAX(score * 1.0 / total), SUM(duration_s),"
+            "       AVG(score * 1.0 / total)"
+            " FROM attempts WHERE total > 0 GROUP BY lesson").fetchall()
+        return {
+            lesson: {"attempts": n, "best_pct": best * 100,
+                     "avg_pct": avg * 100, "time_s": spent}
+            for lesson, n, best, spent, avg in rows
+        }
+
+    def question_stats(self, lesson):
+        """{въпрос: (верни, опити)} за урок n."""
+        rows = self._reader.execute(
+            "SELECT question, SUM(correct), COUNT(*) FROM answers"
+            " WHERE lesson = ? GROUP BY question", (lesson,)).fetchall()
+        return {q: (ok, n) for q, ok, n in rows}
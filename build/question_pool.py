@@ -0,0 +1,118 @@
+"""
+Пул от въпроси с предварително изчислени индекси по урок и по секция.
+
+Всеки опит за викторина е случайна извадка от N въпроса, стратифицирана по
+секциите (заглавията) на урока: всяка секция получава дял пропорционален на
+въпросите си в пула. Извадката е O(N) (алгоритъм на Floyd в рамките на
+секцията) и приема seed за повторяемост.
+
+Въпрос без явна тема (4-ти елемент) получава секцията, с чийто текст има
+най-много общи думи – `infer_topic`. `content_pack.py` прави това при
+компилиране и записва индекса в пакета, за да не се смята при стартиране.
+"""
+import random
+import re
+from array import array
+
+_WORD_RE = re.compile(r"\w+")
+STEM_LEN = 5   # грубо „стемиране“: първите букви (за българските окончания)
+MIN_WORD = 4   # по-кратките думи (предлози, съюзи) не носят смисъл
+
+
+def _stems(text):
+    return {w[:STEM_LEN] for w in _WORD_RE.findall(text.casefold())
+            if len(w) >= MIN_WORD}
+
+
+def split_sections(content, headings):
+    """{заглавие: текст на секцията}; редовете преди първото заглавие се пропускат."""
+    sections, current = {}, None
+    for line in content.splitlines():
+        s = line.strip()
+        if s in headings:
+            current = s
+            sections[current] = [s]
+        elif current is not None and s:
+            sections[current].append(s)
+    return {h: "\n".join(lines) for h, lines in sections.items()}
+
+
+def infer_topic(question, options, sections_stems):
+    """Секцията с най-много общи думи с въпроса и опциите му ("" ако няма)."""
+    words = _stems(question + " " + " ".join(options))
+    best, best_score = "", 0
+    for heading, stems in sections_stems.items():
+        score = len(words & stems)
+        if score > best_score:
+            best, best_score = heading, score
+    return best
+
+
+def tag_quiz(content, headings, quiz):
+    """
+    Връща (въпроси с тема като 4-ти елемент, {тема: [индекси]}).
+    Вече зададените теми се запазват.
+    """
+    sections = {h: _stems(t) for h, t in split_sections(content, headings).items()}
+    tagged, strata = [], {}
+    for i, q in enumerate(quiz):
+        topic = q[3] if len(q) > 3 and q[3] else infer_topic(q[0], q[1], sections)
+        tagged.append((q[0], list(q[1]), q[2], topic))
+        strata.setdefault(topic, []).append(i)
+    return tagged, strata
+
+
+def _floyd(ids, k, rng):
+    """k различни елемента от `ids` за O(k) (алгоритъм на Floyd)."""
+    n = len(ids)
+    chosen = set()
+    for j in range(n - k, n):
+        t = rng.randrange(j + 1)
+        chosen.add(j if t in chosen else t)
+    return [ids[t] for t in chosen]
+
+
+class QuestionPool:
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.questions = []  # глобален id -> (текст, опции, верен, тема)
+        self.by_lesson = {}  # lesson_no -> array от id-та
+        self.by_topic = {}   # lesson_no -> {тема: array от id-та}
+
+    def add_lesson(self, n, quiz, strata=None):
+        """Добавя въпросите на урок n; `strata` = готовият индекс от пакета."""
+        if strata is None:
+            quiz, strata = tag_quiz("", set(), quiz)
+        base = len(self.questions)
+        self.questions.extend(quiz)
+        self.by_lesson[n] = array("I", range(base, base + len(quiz)))
+        self.by_topic[n] = {t: array("I", (base + i for i in idx))
+                            for t, idx in strata.items()}
+
+    def __contains__(self, n):
+        return n in self.by_lesson
+
+    def _quotas(self, strata, size):
+        """Пропорционален дял за всяка секция (метод на най-големия остатък)."""
+        total = sum(len(ids) for ids in strata.values())
+        quotas, rest = {}, []
+        for t, ids in strata.items():
+            exact = size * len(ids) / total
+            quotas[t] = int(exact)
+            rest.append((exact - int(exact), self.rng.random(), t))
+        for _frac, _tie, t in sorted(rest, reverse=True)[:size - sum(quotas.values())]:
+            quotas[t] += 1
+        return quotas
+
+    def sample(self, n, size):
+        """Случайни `size` въпроса от урок n, стратифицирани по секции."""
+        strata = self.by_topic.get(n, {})
+        available = len(self.by_lesson.get(n, ()))
+        size = min(size, available)
+        if size <= 0:
+            return []
+        picked = []
+        for t, k in self._quotas(strata, size).items():
+            picked.extend(_floyd(strata[t], k, self.rng))
+        self.rng.shuffle(picked)
+        return [self.questions[i] for i in picked]
@@ -0,0 +1,223 @@
+"""
+Двигател за викторините: компактно съхранение на въпросите/отговорите и
+изглед по страници с преизползвани уиджети.
+
+  • QuizBank – верните индекси, дадените отговори и темите са в `array`-и;
+    резултатът и разбивката по теми се смятат с един пакетен проход.
+  • QuizView – рисува една страница от `page_size` въпроса в Text поле.
+    Уиджетите (Label + Radiobutton-и) се създават веднъж за слот и само се
+    преконфигурират при смяна на страницата, вместо по Frame за всеки въпрос.
+"""
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import eq
+from tkinter import Button, Frame, IntVar, Label, Radiobutton
+
+NO_ANSWER = -1
+SLOTS_END = "quiz_slots_end"  # маркер в Text полето след последния слот
+PAGER_TAG = "quiz_pager"      # таг върху реда с навигацията (скрива се с elide)
+DEFAULT_TOPIC = ""  # въпроси без тема
+
+
+class QuizBank:
+    """Въпроси (текст, опции, верен индекс[, тема]) + отговорите на потребителя."""
+
+    def __init__(self, questions):
+        self.texts = [q[0] for q in questions]
+        self.options = [list(q[1]) for q in questions]
+        self.correct = array("b", (q[2] for q in questions))
+        self.answers = array("b", [NO_ANSWER]) * len(questions)
+
+        # Темите се пазят като индекси в self.topics (array от uint16)
+        self.topics = []
+        topic_index = {}
+        ids = array("H")
+        for q in questions:
+            t = q[3] if len(q) > 3 and q[3] else DEFAULT_TOPIC
+            if t not in topic_index:
+                topic_index[t] = len(self.topics)
+                self.topics.append(t)
+            ids.append(topic_index[t])
+        self.topic_ids = ids
+        self._topic_totals = Counter(ids)
+
+    def __len__(self):
+        return len(self.correct)
+
+    def answer(self, i, option):
+        self.answers[i] = option
+
+    def reset(self):
+        self.answers = array("b", [NO_ANSWER]) * len(self.correct)
+
+    def answered(self):
+        return len(self.answers) - self.answers.count(NO_ANSWER)
+
+    def hits(self):
+        """Маска 1/0 за верен отговор на всеки въпрос (един проход в C)."""
+        return bytes(map(eq, self.answers, self.correct))
+
+    def score(self, hits=None):
+        return sum(self.hits() if hits is None else hits)
+
+    def breakdown(self, hits=None):
+        """{тема: (верни, общо)} в реда на първата поява на темата."""
+        hits = self.hits() if hits is None else hits
+        by_topic = Counter(compress(self.topic_ids, hits))
+        return {t: (by_topic[k], self._topic_totals[k])
+                for k, t in enumerate(self.topics)}
+
+
+class _Slot:
+    """Един въпрос на страницата: Label + Radiobutton-и, преизползвани между страниците."""
+
+    def __init__(self, parent, on_pick, colors, wraplength):
+        bg, fg = colors
+        self.colors, self.wraplength = colors, wraplength
+        self.on_pick = on_pick
+        self.frame = Frame(parent, bg=bg)
+        self.label = Label(self.frame, bg=bg, fg=fg, font=("Inter", 12, "bold"),
+                           anchor="w", justify="left", wraplength=wraplength)
+        self.var = IntVar(value=NO_ANSWER)
+        self.radios = []
+        self.shown = 0  # колко от радио бутоните са пакетирани
+        self.index = None
+
+    def _radio(self, j):
+        while len(self.radios) <= j:
+            bg, fg = self.colors
+            self.radios.append(Radiobutton(
+                self.frame, variable=self.var, value=len(self.radios),
+                bg=bg, fg=fg, activebackground=bg, selectcolor=bg,
+                anchor="w", justify="left", wraplength=self.wraplength,
+                command=lambda: self.on_pick(self)
+            ))
+        return self.radios[j]
+
+    def show(self, i, text, opts, answer):
+        self.index = i
+        self.label.config(text=f"{i + 1}. {text}")
+        if not self.label.winfo_manager():
+            self.label.pack(fill="x", pady=(8, 2))
+        for j, opt in enumerate(opts):
+            self._radio(j).config(text=opt)
+        # Пакетираме/махаме само разликата спрямо предишната страница
+        for r in self.radios[self.shown:len(opts)]:
+            r.pack(fill="x", padx=12)
+        for r in self.radios[len(opts):self.shown]:
+            r.pack_forget()
+        self.shown = len(opts)
+        self.var.set(answer)
+
+    def hide(self):
+        self.index = None
+        self.label.pack_forget()
+        for r in self.radios[:self.shown]:
+            r.pack_forget()
+        self.shown = 0
+
+
+class QuizView:
+    """
+    Показва `bank` на страници в Text поле `qtxt` (трябва да е празно отдолу).
+    Слотовете и навигацията се вграждат веднъж с window_create; след това
+    смяната на страница само преконфигурира съществуващите уиджети.
+    """
+
+    def __init__(self, qtxt, bank, page_size=10, bg="#C6D6F8", fg="#0F172A",
+                 button_style=None, wraplength=900):
+        self.qtxt = qtxt
+        self.bank = bank
+        self.page_size = max(1, page_size)
+        self.page = 0
+        self.on_page = None  # callback(page) след смяна на страницата
+
+        self.colors, self.wraplength = (bg, fg), wraplength
+        self.slots = []
+        # Маркер след последния слот: left gravity → текстът, добавен след
+        # изгледа (бутони, резултат), остава след него
+        qtxt.mark_set(SLOTS_END, "end-1c")
+        qtxt.mark_gravity(SLOTS_END, "left")
+        self._ensure_slots(min(self.page_size, len(bank)))
+
+        # Навигация между страниците (показва се само ако са повече от една)
+        style = button_style or {}
+        self.pager = Frame(qtxt, bg=bg)
+        self.pager_mapped = False
+        self.btn_prev = Button(self.pager, text="◀ Предишни",
+                               command=lambda: self.show_page(self.page - 1), **style)
+        self.lbl_page = Label(self.pager, bg=bg, fg=fg, font=("Inter", 12))
+        self.btn_next = Button(self.pager, text="Следващи ▶",
+                               command=lambda: self.show_page(self.page + 1), **style)
+        self.btn_prev.pack(side="left", pady=(6, 6))
+        self.lbl_page.pack(side="left", padx=10)
+        self.btn_next.pack(side="left", pady=(6, 6))
+        self._sync_pager()
+
+        self.show_page(0)
+
+    def _embed(self, widget, advance=True):
+        """Вгражда widget + нов ред при маркера; `advance` = маркерът минава след него."""
+        qtxt = self.qtxt
+        state = qtxt.cget("state")
+        qtxt.config(state="normal")
+        idx = qtxt.index(SLOTS_END)
+        qtxt.window_create(idx, window=widget)
+        qtxt.insert(f"{idx}+1c", "\n")
+        qtxt.mark_set(SLOTS_END, f"{idx}+2c" if advance else idx)
+        qtxt.config(state=state)
+        return idx
+
+    def _ensure_slots(self, count):
+        """Добавя слотове (преди навигацията), ако новата банка има нужда от повече."""
+        while len(self.slots) < count:
+            slot = _Slot(self.qtxt, self._pick, self.colors, self.wraplength)
+            self._embed(slot.frame)
+            self.slots.append(slot)
+
+    def _sync_pager(self):
+        """Навигацията се вгражда при първата банка с няколко страници и се скрива при една."""
+        if self.pages > 1 and not self.pager_mapped:
+            idx = self._embed(self.pager, advance=False)  # следващите слотове – преди нея
+            self.qtxt.tag_add(PAGER_TAG, idx, f"{idx}+2c")
+            self.pager_mapped = True
+        if self.pager_mapped:
+            self.qtxt.tag_configure(PAGER_TAG, elide=self.pages == 1)
+
+    def set_bank(self, bank):
+        """Нов опит: същите уиджети, нови въпроси (без повторно изграждане)."""
+        self.bank = bank
+        self._ensure_slots(min(self.page_size, len(bank)))
+        self._sync_pager()
+        self.show_page(0)
+
+    @property
+    def pages(self):
+        return max(1, -(-len(self.bank) // self.page_size))
+
+    def _pick(self, slot):
+        if slot.index is not None:
+            self.bank.answer(slot.index, slot.var.get())
+
+    def show_page(self, page):
+        page = min(max(page, 0), self.pages - 1)
+        self.page = page
+        start = page * self.page_size
+        bank = self.bank
+        for k, slot in enumerate(self.slots):
+            i = start + k
+            if i < len(bank):
+                slot.show(i, bank.texts[i], bank.options[i], bank.answers[i])
+            else:
+                slot.hide()
+        self.lbl_page.config(text=f"Страница {page + 1}/{self.pages}")
+        self.btn_prev.config(state="normal" if page > 0 else "disabled")
+        self.btn_next.config(state="normal" if page < self.pages - 1 else "disabled")
+        self.qtxt.yview_moveto(0)
+        if self.on_page:
+            self.on_page(page)
+
+    def page_of(self, i):
+        """Страницата, на която е въпрос i."""
+        return i // self.page_size
@@ -0,0 +1,150 @@
+"""
+Пълнотекстово търсене в уроците и въпросите (обърнат индекс в паметта).
+
+  • Документ = заглавие на урок, ред от текста (заглавие на секция или
+    обикновен ред) или въпрос заедно с опциите му.
+  • Думите се нормализират с casefold (работи и за кирилица); последната дума
+    от заявката се търси като префикс (за търсене докато се пише).
+  • Индексът се пази на диска (pickle) и се преизгражда само ако пакетът със
+    съдържание се е променил.
+"""
+import heapq
+import pickle
+import re
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+INDEX_VERSION = 2
+_WORD_RE = re.compile(r"\w+")
+MIN_PREFIX = 2  # по-къс префикс би събрал половината речник
+
+# Видове документи (подредени по важност в резултатите)
+DOC_TITLE, DOC_HEADING, DOC_TEXT, DOC_QUIZ = 0, 1, 2, 3
+
+
+def tokenize(text):
+    return _WORD_RE.findall(text.casefold())
+
+
+class SearchIndex:
+    def __init__(self):
+        self.docs = []      # doc id -> (lesson, вид, позиция, текст за показване)
+        self.postings = {}  # дума -> array от doc id-та (нарастващи)
+        self.vocab = []     # сортиран речник (за префиксно търсене)
+
+    # ---------- ИЗГРАЖДАНЕ ----------
+    def add(self, lesson, kind, pos, text, shown=None):
+        doc = len(self.docs)
+        self.docs.append((lesson, kind, pos, shown if shown is not None else text))
+        for word in set(tokenize(text)):
+            self.postings.setdefault(word, array("I")).append(doc)
+        return doc
+
+    def add_lesson(self, n, title, content, headings, quiz):
+        self.add(n, DOC_TITLE, 0, title)
+        for i, line in enumerate(content.splitlines()):
+            s = line.strip()
+            if s:
+                self.add(n, DOC_HEADING if s in headings else DOC_TEXT, i, s)
+        for i, q in enumerate(quiz):
+            self.add(n, DOC_QUIZ, i, q[0] + " " + " ".join(q[1]), shown=q[0])
+
+    def finalize(self):
+        """
+        Преномерира документите по реда на показване (вид, урок, позиция), така
+        че по-малък id = по-важен резултат и подреждането при търсене е безплатно.
+        """
+        docs = self.docs
+        order = sorted(range(len(docs)), key=lambda d: (docs[d][1], docs[d][0], docs[d][2]))
+        new_id = array("I", bytes(4 * len(docs)))
+        for new, old in enumerate(order):
+            new_id[old] = new
+        self.docs = [docs[old] for old in order]
+        self.postings = {w: array("I", sorted(new_id[d] for d in ids))
+                         for w, ids in self.postings.items()}
+        self.vocab = sorted(self.postings)
+        return self
+
+    @classmethod
+    def build(cls, lessons):
+        """
+        Индекс от речник lesson_no -> (title, content, headings, quiz, ...).
+        При ContentPack уроците се четат с `read`, без да остават в паметта.
+        """
+        read = getattr(lessons, "read", lessons.__getitem__)
+        index = cls()
+        for n in sorted(lessons):
+            title, content, headings, quiz = read(n)[:4]
+            index.add_lesson(n, title, content, headings, quiz)
+        return index.finalize()
+
+    # ---------- ТЪРСЕНЕ ----------
+    def _prefix_docs(self, prefix):
+        docs = set()
+        i = bisect_left(self.vocab, prefix)
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix):
+            docs.update(self.postings[self.vocab[i]])
+            i += 1
+        return docs
+
+    def search(self, query, limit=20):
+        """Списък (lesson, вид, позиция, текст) за документите с всички думи."""
+        words = tokenize(query)
+        if not words:
+            return []
+        *exact, last = words
+        sets = []
+        for w in exact:
+            if w not in self.postings:
+                return []
+            sets.append(self.postings[w])
+        if len(last) >= MIN_PREFIX:
+            sets.append(self._prefix_docs(last))
+        elif last in self.postings:
+            sets.append(self.postings[last])
+        else:
+            return []
+        sets.sort(key=len)  # сечението започва от най-малкото множество
+        found = set(sets[0])
+        for s in sets[1:]:
+            found.intersection_update(s)
+            if not found:
+                return []
+        return [self.docs[d] for d in heapq.nsmallest(limit, found)]
+
+    def terms(self, query):
+        """Нормализираните думи от заявката (за подчертаване)."""
+        return tokenize(query)
+
+    # ---------- КЕШ НА ДИСКА ----------
+    @classmethod
+    def load_or_build(cls, pack, cache_path):
+        """Взима индекса от `cache_path`, ако е за същия пакет; иначе го изгражда."""
+        st = Path(pack.path).stat()
+        key = (INDEX_VERSION, st.st_mtime_ns, st.st_size)
+        cache_path = Path(cache_path)
+        try:
+            with open(cache_path, "rb") as fh:
+                cached_key, index = pickle.load(fh)
+            if cached_key == key:
+                return index
+        except (OSError, pickle.PickleError, EOFError, ValueError,
+                AttributeError, ImportError):  # стар/чужд pickle
+            pass
+        index = cls.build(pack)
+        try:
+            with open(cache_path, "wb") as fh:
+                pickle.dump((key, index), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Неуспешен запис на индекса {cache_path}: {e}")
+        return index
+
+
+def line_matches(text, terms):
+    """Дали редът съдържа всички думи (последната – като префикс)."""
+    if not terms:
+        return False
+    words = tokenize(text)
+    *exact, last = terms
+    return all(w in words for w in exact) and any(w.startswith(last) for w in words)
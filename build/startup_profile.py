@@ -0,0 +1,80 @@
+"""
+Замерване на стартирането на приложението по фази.
+
+Включва се с променливата на средата QA_APP_PROFILE:
+    QA_APP_PROFILE=1              → таблица в stderr при първия idle
+    QA_APP_PROFILE=startup.json   → същото, записано като JSON
+
+Изключеният профайлър не прави нищо (phase/record струват едно if).
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    def __init__(self, enabled=False, target=None):
+        self.t0 = time.perf_counter()  # ≈ началото на импорта на gui.py
+        self.enabled = enabled
+        self.target = target
+        self.events = []  # (име, начало ms, продължителност ms) спрямо t0
+
+    def _ms(self, t):
+        return (t - self.t0) * 1000
+
+    def record(self, name, start, end):
+        """Записва фаза по две стойности от time.perf_counter()."""
+        if self.enabled:
+            self.events.append((name, self._ms(start), (end - start) * 1000))
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def mark(self, name):
+        """Моментно събитие (напр. 'first_idle') с нулева продължителност."""
+        now = time.perf_counter()
+        self.record(name, now, now)
+
+    def as_dict(self):
+        return {
+            "phases": [{"name": n, "start_ms": round(s, 3), "ms": round(d, 3)}
+                       for n, s, d in self.events],
+            "total_ms": round(max((s + d for _n, s, d in self.events),
+                                  default=0.0), 3),
+        }
+
+    def report(self):
+        lines = [f"{'фаза':<32}{'старт ms':>10}{'ms':>10}"]
+        for n, s, d in self.events:
+            lines.append(f"{n:<32}{s:>10.1f}{d:>10.1f}")
+        return "\n".join(lines)
+
+    def finish(self):
+        """Вика се при първия idle: маркира го и извежда резултата."""
+        if not self.enabled:
+            return
+        self.mark("first_idle")
+        if self.target:
+            with open(self.target, "w", encoding="utf-8") as fh:
+                json.dump(self.as_dict(), fh, ensure_ascii=False, indent=2)
+        else:
+            print(self.report(), file=sys.stderr)
+
+
+def from_env(var="QA_APP_PROFILE"):
+    """Профайлър според променливата на средата (виж docstring-а на модула)."""
+    value = os.environ.get(var, "")
+    if value in ("", "0"):
+        return StartupProfiler(enabled=False)
+    return StartupProfiler(enabled=True,
+                           target=None if value == "1" else value)